@@ -1,9 +1,5 @@
 import sys
 
-# Always import and patch import hooks before loading anything else
-from .internal.import_hooks import patch as patch_import_hooks
-patch_import_hooks()  # noqa: E402
-
 from .monkey import patch, patch_all
 from .pin import Pin
 from .span import Span
@@ -49,11 +49,12 @@ being loaded and re-calling `__import__` for the module to trigger the other fin
 
 For these reasons we have decided to patch Python's internal module loading functions instead.
 """
+import functools
 import threading
 import sys
 
 from ..compat import PY3
-from ..vendor import wrapt
+from ..vendor.six.moves import builtins, intern
 from .logger import get_logger
 
 __all__ = ["hooks", "register_module_hook", "patch", "unpatch"]
@@ -62,13 +63,24 @@ log = get_logger(__name__)
 
 ORIGINAL_IMPORT = __import__
 
+# DEV: Bind `sys.modules` once to avoid an attribute lookup on every `__import__` call
+_sys_modules = sys.modules
+
+# Module objects we have already called hooks for, keyed by module name
+# DEV: We store the module object and not just the name so a module which is removed from
+#      `sys.modules` and imported again still gets its hooks called
+_fired = dict()
+
+# Functions replaced by `patch()` as `(parent, attribute name, original)`, restored by `unpatch()`
+_installed = dict()
+
 
 class ModuleHookRegistry(object):
     """
     Registry to keep track of all module import hooks defined
     """
 
-    __slots__ = ("hooks", "lock")
+    __slots__ = ("hooks", "lock", "_callbacks")
 
     def __init__(self):
         """
@@ -83,16 +95,30 @@ class ModuleHookRegistry(object):
 
         If the module is already loaded, then ``func`` is called immediately
 
+        The first hook registered with the global registry patches the import system, see :func:`patch`.
+        This only happens once, registering more hooks after :func:`unpatch` does not patch again
+
         :param name: The name of the module to add the hook for (e.g. 'requests', 'flask.app', etc)
         :type name: str
         :param func: The function to register as a hook
         :type func: function(module)
         """
+        # DEV: Module names coming from the import system are interned, interning ours as well
+        #      lets dict lookups for them match on identity instead of comparing strings
+        if isinstance(name, str):
+            name = intern(name)
+
+        # DEV: Only patch the import system once someone needs it, until then imports run unwrapped
+        #      Only the global registry is called from the import system, so other registries do not patch
+        if self is hooks:
+            _patch_on_first_register()
+
         with self.lock:
             if name not in self.hooks:
                 self.hooks[name] = set([func])
             else:
                 self.hooks[name].add(func)
+            self._update_callbacks(name)
 
             # Module is already loaded, call hook right away
             if name in sys.modules:
@@ -116,9 +142,33 @@ class ModuleHookRegistry(object):
             # Remove this function from the hooks if exists
             if func in self.hooks[name]:
                 self.hooks[name].remove(func)
+                self._update_callbacks(name)
             else:
                 log.debug("No hook %r registered for module %r", func, name)
 
+    def _update_callbacks(self, name):
+        """
+        Rebuild the tuple of hooks :meth:`call` uses for the provided module name
+
+        DEV: Must be called while holding the lock, any time ``self.hooks[name]`` changes
+        """
+        if self.hooks.get(name):
+            self._callbacks[name] = tuple(self.hooks[name])
+        else:
+            self._callbacks.pop(name, None)
+
+    def has(self, name):
+        """
+        Return whether any hooks are registered for the provided module name
+
+        DEV: This does not acquire the lock, it is meant as a cheap check before calling :meth:`call`
+
+        :param name: The name of the module to check (e.g. 'requests', 'flask.app', etc)
+        :type name: str
+        :rtype: bool
+        """
+        return name in self._callbacks
+
     def call(self, name, module=None):
         """
         Call all hooks for the provided module
@@ -130,32 +180,37 @@ class ModuleHookRegistry(object):
         :param module: Optional, the module object to pass to hook functions
         :type module: Module|None
         """
-        with self.lock:
-            # Make sure we have hooks for this module
-            if not self.hooks.get(name):
-                log.debug("No hooks registered for module %r", name)
-                return
-
-            # Try to fetch from `sys.modules` if one wasn't given directly
-            if module is None:
-                module = sys.modules.get(name)
-
-            # No module found, don't call anything
-            if not module:
-                log.warning("Tried to call hooks for unloaded module %r", name)
-                return
-
-            # Call all hooks for this module
-            for hook in self.hooks[name]:
-                try:
-                    hook(module)
-                except Exception:
-                    log.warning("Failed to call hook %r for module %r", hook, name, exc_info=True)
+        # DEV: We use the tuple of hooks built at registration time instead of iterating
+        #      ``self.hooks[name]``, this way we do not need to hold the lock while calling
+        #      hooks, which may themselves import modules with hooks
+        callbacks = self._callbacks.get(name)
+
+        # Make sure we have hooks for this module
+        if not callbacks:
+            log.debug("No hooks registered for module %r", name)
+            return
+
+        # Try to fetch from `sys.modules` if one wasn't given directly
+        if module is None:
+            module = sys.modules.get(name)
+
+        # No module found, don't call anything
+        if not module:
+            log.warning("Tried to call hooks for unloaded module %r", name)
+            return
+
+        # Call all hooks for this module
+        for hook in callbacks:
+            try:
+                hook(module)
+            except Exception:
+                log.warning("Failed to call hook %r for module %r", hook, name, exc_info=True)
 
     def reset(self):
         """Reset/remove all registered hooks"""
         with self.lock:
             self.hooks = dict()
+            self._callbacks = dict()
 
 
 # Default/global module hook registry
@@ -166,16 +221,45 @@ def exec_and_call_hooks(module_name, wrapped, args, kwargs):
     """
     Helper used to execute the wrapped function with args/kwargs and then call any
       module hooks for `module_name` after
+
+    DEV: If the wrapped function raises (e.g. `ImportError`) we do not call any hooks
     """
+    result = wrapped(*args, **kwargs)
+
+    # Most modules have no hooks, skip the call into the registry for them
+    if not hooks.has(module_name):
+        return result
+
+    # Only call hooks once for each loaded module
+    # DEV: The module may not be in `sys.modules` under this name, e.g. relative imports in Python 2
+    module = _sys_modules.get(module_name)
+    if module is None or _fired.get(module_name) is module:
+        return result
+    _fired[module_name] = module
+
+    # Never let this function fail to execute
     try:
-        return wrapped(*args, **kwargs)
-    finally:
-        # Never let this function fail to execute
+        hooks.call(module_name, module)
+    except Exception:
+        log.debug("Failed to call hooks for module %r", module_name, exc_info=True)
+    return result
+
+
+# Python 3 added specs, no need to even check for `__spec__` if we are in Python 2
+# DEV: Pick the implementation once here instead of checking `PY3` on every reload
+if PY3:
+
+    def _get_module_name(module):
         try:
-            # DEV: `hooks.call()` will only call hooks if the module was successfully loaded
-            hooks.call(module_name)
-        except Exception:
-            log.debug("Failed to call hooks for module %r", module_name, exc_info=True)
+            return module.__spec__.name
+        except AttributeError:
+            return module.__name__
+
+
+else:
+
+    def _get_module_name(module):
+        return module.__name__
 
 
 def wrapped_reload(wrapped, instance, args, kwargs):
@@ -184,17 +268,13 @@ def wrapped_reload(wrapped, instance, args, kwargs):
     """
     module_name = None
     try:
-        # Python 3 added specs, no need to even check for `__spec__` if we are in Python 2
-        if PY3:
-            try:
-                module_name = args[0].__spec__.name
-            except AttributeError:
-                module_name = args[0].__name__
-        else:
-            module_name = args[0].__name__
+        module_name = _get_module_name(args[0])
     except Exception:
         log.debug("Failed to determine module name when calling `reload`: %r", args, exc_info=True)
 
+    # Always call hooks again when a module is reloaded
+    _fired.pop(module_name, None)
+
     return exec_and_call_hooks(module_name, wrapped, args, kwargs)
 
 
@@ -205,35 +285,72 @@ def wrapped_find_and_load_unlocked(wrapped, instance, args, kwargs):
 
     NOTE: This code does not get called for module reloading
     """
-    module_name = None
-    try:
-        module_name = args[0]
-    except Exception:
-        log.debug("Failed to determine module name when importing module: %r", args, exc_info=True)
-        return wrapped(*args, **kwargs)
-
-    return exec_and_call_hooks(module_name, wrapped, args, kwargs)
+    # DEV: `_find_and_load_unlocked(name, import_)` is only called internally by `importlib._bootstrap`,
+    #      always with the module name as the first positional argument, see the versions listed in `_patch()`
+    return exec_and_call_hooks(args[0], wrapped, args, kwargs)
 
 
 def wrapped_import(*args, **kwargs):
     """
     Wrapper for `__import__` so we can trigger hooks on module loading
     """
-    module_name = kwargs.get("name", args[0])
+    # DEV: This is called for every `import` statement, keep the common path as cheap as possible
+    #      e.g. no exception handling and no attribute lookups on `sys`
+    module_name = args[0] if args else kwargs.get("name")
 
     # Do not call the hooks every time `import <module>` is called,
     #   only on the first time it is loaded
-    if module_name and module_name not in sys.modules:
+    if module_name and module_name not in _sys_modules:
         return exec_and_call_hooks(module_name, ORIGINAL_IMPORT, args, kwargs)
 
     return ORIGINAL_IMPORT(*args, **kwargs)
 
 
+def _wrap_function(wrapped, wrapper):
+    """
+    Create a plain function which calls ``wrapper(wrapped, None, args, kwargs)``
+
+    DEV: We do not use `wrapt.FunctionWrapper` here since these functions are called on every
+         module load, and the proxy object adds extra Python-level dispatch to each call
+    """
+
+    @functools.wraps(wrapped)
+    def wrapper_func(*args, **kwargs):
+        return wrapper(wrapped, None, args, kwargs)
+
+    return wrapper_func
+
+
+def _install(key, parent, name, func):
+    """
+    Replace ``parent.<name>`` with ``func``, keeping track of the original for `unpatch()`
+    """
+    # DEV: If a previous `_patch()` failed partway, keep what we already installed,
+    #      otherwise we would record our own wrapper as the original
+    if key in _installed:
+        return
+    _installed[key] = (parent, name, getattr(parent, name))
+    setattr(parent, name, func)
+
+
 # Keep track of whether we have patched or not
 _patched = False
 
+# Keep track of whether registering a hook has already patched, see `_patch_on_first_register()`
+# DEV: This is not reset by `unpatch()`, so an explicit `unpatch()` stays in effect
+_auto_patched = False
+
+# DEV: `patch()` is called from `ModuleHookRegistry.register()` which can happen from any thread
+#      This is re-entrant so `_patch_on_first_register()` can hold it while calling `patch()`
+_patch_lock = threading.RLock()
+
 
 def _patch():
+    with _patch_lock:
+        _patch_unlocked()
+
+
+def _patch_unlocked():
     # Only patch once
     global _patched
     if _patched:
@@ -241,6 +358,8 @@ def _patch():
 
     # 3.x
     if PY3:
+        import importlib
+
         # 3.4: https://github.com/python/cpython/blob/3.4/Lib/importlib/_bootstrap.py#L2207-L2231
         # 3.5: https://github.com/python/cpython/blob/3.5/Lib/importlib/_bootstrap.py#L938-L962
         # 3.6: https://github.com/python/cpython/blob/3.6/Lib/importlib/_bootstrap.py#L936-L960
@@ -251,32 +370,37 @@ def _patch():
         #   e.g. `__import__` which calls `importlib._bootstrap._find_and_load()`
         #        `importlib.__import__/importlib._bootstrap.__import__` which calls `importlib._bootstrap._gcd_import()`
         #        `importlib.import_module` which calls `importliob._bootstrap._gcd_import()`
-        wrapt.wrap_function_wrapper("importlib._bootstrap", "_find_and_load_unlocked", wrapped_find_and_load_unlocked)
+        _install(
+            "find_and_load_unlocked",
+            importlib._bootstrap,
+            "_find_and_load_unlocked",
+            _wrap_function(importlib._bootstrap._find_and_load_unlocked, wrapped_find_and_load_unlocked),
+        )
 
         # 3.4: https://github.com/python/cpython/blob/3.4/Lib/importlib/__init__.py#L115-L156
         # 3.5: https://github.com/python/cpython/blob/3.5/Lib/importlib/__init__.py#L132-L173
         # 3.6: https://github.com/python/cpython/blob/3.6/Lib/importlib/__init__.py#L132-L173
         # 3.7: https://github.com/python/cpython/blob/3.7/Lib/importlib/__init__.py#L133-L176
         # 3.8: https://github.com/python/cpython/blob/3.8/Lib/importlib/__init__.py#L133-L176
-        wrapt.wrap_function_wrapper("importlib", "reload", wrapped_reload)
+        _install("reload", importlib, "reload", _wrap_function(importlib.reload, wrapped_reload))
 
     # 2.7
     # DEV: Slightly more direct approach of patching `__import__` and `reload` functions
     elif sys.version_info >= (2, 7):
         # https://github.com/python/cpython/blob/2.7/Python/bltinmodule.c#L35-L68
-        if __builtins__["__import__"] is not wrapped_import:
+        if builtins.__import__ is not wrapped_import:
             global ORIGINAL_IMPORT
-            ORIGINAL_IMPORT = __builtins__["__import__"]
-            __builtins__["__import__"] = wrapped_import
+            ORIGINAL_IMPORT = builtins.__import__
+            _install("__import__", builtins, "__import__", wrapped_import)
 
         # https://github.com/python/cpython/blob/2.7/Python/bltinmodule.c#L2147-L2160
-        __builtins__["reload"] = wrapt.FunctionWrapper(__builtins__["reload"], wrapped_reload)
+        _install("reload", builtins, "reload", _wrap_function(builtins.reload, wrapped_reload))
 
     # Update after we have successfully patched
     _patched = True
 
 
-# DEV: This is called at the end of this module to ensure we always patch
+# DEV: This is called when the first hook is registered with the global registry
 def patch():
     """
     Patch Python import system, enabling import hooks
@@ -288,37 +412,34 @@ def patch():
         log.warning("Failed to patch module importing, import hooks will not work", exc_info=True)
 
 
-def unpatch():
+def _patch_on_first_register():
     """
-    Unpatch Python import system, disabling import hooks
+    Patch Python import system the first time a hook is registered with the global registry
     """
-    # Only patch once
-    global _patched
-    if not _patched:
-        return
-    _patched = False
+    global _auto_patched
+    with _patch_lock:
+        if _auto_patched:
+            return
+        _auto_patched = True
+        patch()
 
-    # 3.4 -> 3.8
-    # DEV: Explicitly stop at 3.8 in case the functions we are patching change in any way,
-    #      we need to validate them before adding support here
-    if (3, 4) <= sys.version_info <= (3, 8):
-        import importlib
 
-        if isinstance(importlib._bootstrap._find_and_load_unlocked, wrapt.FunctionWrapper):
-            setattr(
-                importlib._bootstrap,
-                "_find_and_load_unlocked",
-                importlib._bootstrap._find_and_load_unlocked.__wrapped__,
-            )
-        if isinstance(importlib.reload, wrapt.FunctionWrapper):
-            setattr(importlib, "reload", importlib.reload.__wrapped__)
+def unpatch():
+    """
+    Unpatch Python import system, disabling import hooks
 
-    # 2.7
-    # DEV: Slightly more direct approach
-    elif sys.version_info >= (2, 7):
-        __builtins__["__import__"] = ORIGINAL_IMPORT
-        if isinstance(__builtins__["reload"], wrapt.FunctionWrapper):
-            __builtins__["reload"] = __builtins__["reload"].__wrapped__
+    Registering more hooks afterwards does not patch again, call :func:`patch` to re-enable import hooks
+    """
+    global _patched
+    with _patch_lock:
+        _patched = False
+
+        # Restore exactly what we replaced in `_patch()`
+        # DEV: Do this even if we never finished patching, `_patch()` may have failed partway
+        for parent, name, original in _installed.values():
+            setattr(parent, name, original)
+        _installed.clear()
+        _fired.clear()
 
 
 def register_module_hook(module_name, func=None, registry=hooks):
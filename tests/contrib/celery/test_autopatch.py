@@ -1,13 +1,68 @@
 #!/usr/bin/env python
-import subprocess
+import multiprocessing
+import sys
 import unittest
 
 
+# DEV: Python 2 does not have start methods, it always forks on POSIX
+if hasattr(multiprocessing, 'get_context'):
+    _mp = multiprocessing.get_context('fork')
+else:
+    _mp = multiprocessing
+
+# Modules to unload in the child so celery has to be imported again after patching
+_UNLOAD_PREFIXES = ('celery', 'ddtrace.contrib.celery', 'tests.contrib.celery.autopatch')
+
+
+def _run_autopatch(conn):
+    try:
+        # DEV: celery 4 ships a pytest plugin, so pytest marks the `celery` package for assertion rewriting,
+        #      which makes its `AssertionRewritingHook` the loader when celery is imported again below.
+        #      The post-import hook finder used by `patch_all()` calls the legacy `load_module()` on that
+        #      loader, which it does not implement. We do not need assertion rewriting in this process.
+        sys.meta_path[:] = [
+            finder for finder in sys.meta_path
+            if not (
+                type(finder).__module__ == '_pytest.assertion.rewrite'
+                and type(finder).__name__ == 'AssertionRewritingHook'
+            )
+        ]
+
+        # DEV: Other celery tests have already imported celery in this process, unload it
+        #      (and our integration, which holds a reference to it) so `patch_all()` has to
+        #      rely on the post-import hook, like it does with `ls-trace-run`
+        for name in list(sys.modules):
+            if any(name == prefix or name.startswith(prefix + '.') for prefix in _UNLOAD_PREFIXES):
+                del sys.modules[name]
+        assert 'celery' not in sys.modules
+
+        # DEV: This is what `ls-trace-run` does on startup
+        from ddtrace import patch_all
+        patch_all()
+
+        from tests.contrib.celery import autopatch
+        conn.send(autopatch.RESULT)
+    except Exception as e:
+        conn.send(repr(e))
+    finally:
+        conn.close()
+
+
 class DdtraceRunTest(unittest.TestCase):
     """Test that celery is patched successfully if run with ls-trace-run."""
 
     def test_autopatch(self):
-        out = subprocess.check_output(
-            ['ls-trace-run', 'python', 'tests/contrib/celery/autopatch.py']
-        )
-        assert out.startswith(b'Test success')
+        # DEV: Run in a forked process so patching does not leak into other tests,
+        #      without paying for a new interpreter and `ls-trace-run` bootstrap
+        parent_conn, child_conn = _mp.Pipe(duplex=False)
+        proc = _mp.Process(target=_run_autopatch, args=(child_conn, ))
+        proc.start()
+        try:
+            assert parent_conn.poll(30), 'autopatch process did not report a result'
+            assert parent_conn.recv() == 'Test success'
+        finally:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+        assert proc.exitcode == 0
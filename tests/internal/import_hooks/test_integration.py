@@ -1,9 +1,11 @@
 import contextlib
 import mock
 import sys
+import unittest
 
 import pytest
 
+from ddtrace.compat import PY3
 from ddtrace.internal import import_hooks
 
 from tests.subprocesstest import run_in_subprocess, SubprocessTestCase
@@ -140,3 +142,143 @@ class ImportHookTestCase(SubprocessTestCase):
         test_module_hook.assert_called_once_with(tests.test_module)
         test_module_hook2.assert_called_once_with(tests.test_module)
         test_module2_hook.assert_called_once_with(tests.test_module2)
+
+    def test_reimport_after_removal(self):
+        """
+        When a module is removed from `sys.modules` and imported again
+            The import hook should run again for the new module
+        """
+        module_hook = mock.Mock()
+        import_hooks.register_module_hook("tests.test_module", module_hook)
+
+        import tests.test_module
+
+        module_hook.assert_called_once_with(tests.test_module)
+        first_module = tests.test_module
+
+        del sys.modules["tests.test_module"]
+        import tests.test_module  # noqa
+
+        assert tests.test_module is not first_module
+        assert module_hook.call_count == 2
+        module_hook.assert_called_with(tests.test_module)
+
+    def test_hook_imports_hooked_module(self):
+        """
+        When an import hook imports another module with hooks
+            Both import hooks should run
+        """
+        test_module2_hook = mock.Mock()
+
+        def test_module_hook(module):
+            import tests.test_module2  # noqa
+
+        import_hooks.register_module_hook("tests.test_module", test_module_hook)
+        import_hooks.register_module_hook("tests.test_module2", test_module2_hook)
+
+        import tests.test_module  # noqa
+
+        test_module2_hook.assert_called_once_with(sys.modules["tests.test_module2"])
+
+    def test_reload(self):
+        """
+        When a module is reloaded
+            The import hook should run exactly once for each reload
+        """
+        module_hook = mock.Mock()
+        import_hooks.register_module_hook("tests.test_module", module_hook)
+        import tests.test_module
+
+        module_hook.assert_called_once_with(tests.test_module)
+
+        # DEV: `ddtrace.compat.reload_module` is resolved before import hooks are patched
+        if PY3:
+            import importlib
+
+            importlib.reload(tests.test_module)
+        else:
+            reload(tests.test_module)  # noqa: F821
+
+        assert module_hook.call_count == 2
+        module_hook.assert_called_with(tests.test_module)
+
+    def test_unpatch(self):
+        """
+        When the import system is unpatched
+            The import hook should not run when the module is imported
+        """
+        module_hook = mock.Mock()
+        import_hooks.register_module_hook("tests.test_module", module_hook)
+
+        import_hooks.unpatch()
+        try:
+            import tests.test_module  # noqa
+        finally:
+            import_hooks.patch()
+
+        module_hook.assert_not_called()
+
+    def test_failed_import(self):
+        """
+        When importing a module with an import hook fails
+            The import hook should not run
+        """
+        module_hook = mock.Mock()
+        import_hooks.register_module_hook("tests.test_module_does_not_exist", module_hook)
+
+        with pytest.raises(ImportError):
+            import tests.test_module_does_not_exist  # noqa
+
+        module_hook.assert_not_called()
+
+    def test_patch_on_register(self):
+        """
+        When registering the first import hook
+            The import system is patched
+        """
+        assert import_hooks._patched is False
+
+        # Other registries are never called from the import system, they do not patch
+        import_hooks.register_module_hook("tests.test_module", mock.Mock(), registry=import_hooks.ModuleHookRegistry())
+        assert import_hooks._patched is False
+
+        import_hooks.register_module_hook("tests.test_module", mock.Mock())
+        assert import_hooks._patched is True
+
+    @unittest.skipIf(not PY3, "Python 2 patches `__import__` instead of `_find_and_load_unlocked`")
+    def test_patch_twice_unpatch(self):
+        """
+        When the import system is patched more than once
+            Unpatching restores the original functions
+        """
+        import importlib
+
+        original = importlib._bootstrap._find_and_load_unlocked
+        original_reload = importlib.reload
+
+        import_hooks.patch()
+        import_hooks.patch()
+        assert importlib._bootstrap._find_and_load_unlocked is not original
+
+        import_hooks.unpatch()
+        assert importlib._bootstrap._find_and_load_unlocked is original
+        assert importlib.reload is original_reload
+
+    def test_register_after_unpatch(self):
+        """
+        When registering an import hook after the import system was unpatched
+            The import system is not patched again
+            The import hook should not run when the module is imported
+        """
+        import_hooks.register_module_hook("tests.test_module", mock.Mock())
+        assert import_hooks._patched is True
+
+        import_hooks.unpatch()
+
+        module_hook = mock.Mock()
+        import_hooks.register_module_hook("tests.test_module2", module_hook)
+        assert import_hooks._patched is False
+
+        import tests.test_module2  # noqa
+
+        module_hook.assert_not_called()
@@ -57,6 +57,23 @@ def test_registry_reset(hooks, module_hook):
     assert len(hooks.hooks) == 0
 
 
+def test_registry_has(hooks, module_hook):
+    """
+    When checking if a module has hooks
+        We only report modules with at least one registered hook
+    """
+    module_name = "test.module.name"
+    assert hooks.has(module_name) is False
+
+    hooks.register(module_name, module_hook)
+    assert hooks.has(module_name) is True
+    assert hooks.has("test.module.other") is False
+
+    # Removing the last hook means the module no longer has hooks
+    hooks.deregister(module_name, module_hook)
+    assert hooks.has(module_name) is False
+
+
 def test_registry_call_with_module(hooks):
     """
     When calling module hooks